@@ -36,6 +36,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# SCL classes to mask out: Saturated(1), Shadow(3), Water(6), Cloud(9), Snow(11).
+# We also treat Medium Cloud(8) and Cirrus(10) as noise for abandonment detection.
+# Sized to 256 so any uint8 SCL raster can index it directly.
+_SCL_MASKED = np.zeros(256, dtype=bool)
+_SCL_MASKED[[1, 3, 6, 8, 9, 10, 11]] = True
+_SCL_MASKED.flags.writeable = False
+
 class SatelliteExtractor:
     """
     Extracts environmental features from Sentinel-2 imagery.
@@ -82,11 +89,11 @@ class SatelliteExtractor:
         
         Algorithm adapted from: swegmueller/Sentinel_2_and_HLS_tools
         """
-        # Mask out: Saturated(1), Shadow(3), Water(6), Cloud(9), Snow(11)
-        # We also treat Medium Cloud(8) and Cirrus(10) as noise for abandonment detection
-        mask_values = {1, 3, 6, 8, 9, 10, 11}
-        
-        if scl_value in mask_values:
+        # Table lookup against _SCL_MASKED instead of a set/if ladder.
+        # Masked rasters often yield float codes (3.0), so whole-number
+        # floats index like ints; NaN or fractional codes are never masked.
+        code = int(scl_value) if float(scl_value).is_integer() else -1
+        if 0 <= code < _SCL_MASKED.size and _SCL_MASKED[code]:
             logger.debug(f"Pixel masked due to SCL class: {scl_value}")
             return {
                 'ndvi_mean': None,
@@ -96,6 +103,20 @@ class SatelliteExtractor:
             
         return bands
 
+    def mask_scl_array(self, band: np.ndarray, scl: np.ndarray) -> np.ndarray:
+        """
+        Whole-raster version of mask_clouds_and_shadows.
+        
+        Args:
+            band: Per-pixel index values (e.g. NDVI)
+            scl: SCL class codes with the same shape (uint8 rasters)
+            
+        Returns:
+            float array with masked pixels set to NaN, so np.nanmean()
+            skips them when aggregating.
+        """
+        return np.where(_SCL_MASKED[scl], np.nan, band)
+
     def extract_features(
         self, 
         latitude: float, 
@@ -11,13 +11,16 @@ Final_P = (w_rf * P_rf) + (w_spatial * P_spatial) + (w_kde * P_kde)
 
 Optimization:
 The weights (w) are not guessed. They are "learned" by maximizing performance
-on a validation set via Grid Search.
+on a validation set via Grid Search. All grid points are scored in one
+vectorized pass (matrix product + rank-based AUC) rather than one
+roc_auc_score call per point.
 """
 
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, List
-from sklearn.metrics import f1_score, roc_auc_score
+from scipy.stats import rankdata
+from sklearn.metrics import f1_score
 
 class EnsemblePredictor:
     
@@ -46,16 +49,15 @@ class EnsemblePredictor:
         
         # 1. Pre-calculate predictions from each model (Outcome cache)
         # This is fast because we just look up scores, then we iterate weights.
-        p_rf = self.rf_model.predict_proba(X_val)[:, 1]
-        p_spatial = self.spatial_model.predict_proba(coords_val)
-        p_kde = self.kde_model.predict_proba(coords_val)
+        # Missing models (testing) contribute zeros, as in predict_proba.
+        p_rf = self.rf_model.predict_proba(X_val)[:, 1] if self.rf_model else np.zeros(len(X_val))
+        p_spatial = self.spatial_model.predict_proba(coords_val) if self.spatial_model else np.zeros(len(coords_val))
+        p_kde = self.kde_model.predict_proba(coords_val) if self.kde_model else np.zeros(len(coords_val))
         
-        best_score = -1
-        best_weights = self.weights
-        
-        # 2. Grid Search
+        # 2. Grid of candidate weights
         # Increment by 0.1 steps
         steps = np.arange(0, 1.1, 0.1)
+        candidates = []
         
         for w_rf in steps:
             for w_sp in steps:
@@ -64,24 +66,45 @@ class EnsemblePredictor:
                 # Constraint: w3 must be non-negative and sum roughly to 1
                 if w_kde < 0 or not np.isclose(w_rf + w_sp + w_kde, 1.0):
                     continue
-                    
-                # Calculate Ensemble Score
-                p_ensemble = (w_rf * p_rf) + (w_sp * p_spatial) + (w_kde * p_kde)
-                
-                # Evaluate (AUC is good because it's threshold independent)
-                try:
-                    score = roc_auc_score(y_val, p_ensemble)
-                except ValueError:
-                    score = 0
-                
-                if score > best_score:
-                    best_score = score
-                    best_weights = {'rf': w_rf, 'spatial': w_sp, 'kde': w_kde}
+                candidates.append((w_rf, w_sp, w_kde))
+        
+        # 3. Score every candidate at once: [n_candidates, 3] @ [3, n_samples]
+        # gives all ensemble predictions as one matrix, ranked in a single pass.
+        weight_grid = np.array(candidates)
+        p_ensembles = weight_grid @ np.vstack([p_rf, p_spatial, p_kde])
+        
+        # Evaluate (AUC is good because it's threshold independent)
+        scores = self._batch_roc_auc(np.asarray(y_val), p_ensembles)
+        
+        # argmax keeps the first best candidate, same as a strict ">" scan
+        best_idx = int(np.argmax(scores))
+        best_score = scores[best_idx]
+        w_rf, w_sp, w_kde = candidates[best_idx]
+        best_weights = {'rf': w_rf, 'spatial': w_sp, 'kde': w_kde}
         
         print(f"Best Ensemble AUC: {best_score:.4f} with weights {best_weights}")
         self.weights = best_weights
         return best_weights
 
+    @staticmethod
+    def _batch_roc_auc(y_true: np.ndarray, y_scores: np.ndarray) -> np.ndarray:
+        """
+        ROC AUC of each row of y_scores against the same binary labels.
+        
+        Uses the Mann-Whitney rank formulation (ties get average ranks),
+        which equals sklearn's roc_auc_score. Returns 0 for every row when
+        y_true has a single class, where AUC is undefined.
+        """
+        positives = (y_true == 1)
+        n_pos = int(np.count_nonzero(positives))
+        n_neg = positives.size - n_pos
+        if n_pos == 0 or n_neg == 0:
+            return np.zeros(len(y_scores))
+        
+        ranks = rankdata(y_scores, axis=1)
+        rank_sum = ranks[:, positives].sum(axis=1)
+        return (rank_sum - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+
     def predict_proba(self, X: pd.DataFrame, coords: np.ndarray) -> np.ndarray:
         """
         Get combined probability.
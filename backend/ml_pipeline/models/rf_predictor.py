@@ -22,6 +22,7 @@ Why it's good for this task:
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
+from joblib import parallel_config
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from sklearn.feature_selection import SelectKBest, f_classif
@@ -36,13 +37,19 @@ class RandomForestPredictor:
     Feature-based predictor using Random Forest Classifier.
     """
     
-    def __init__(self, n_estimators: int = 100, max_depth: int = None, class_weight: str = 'balanced'):
+    # Below this many rows, spinning up joblib workers costs more than
+    # scoring the trees serially, so prediction runs single-threaded.
+    PARALLEL_PREDICT_MIN_ROWS = 1000
+    
+    def __init__(self, n_estimators: int = 100, max_depth: int = None, class_weight: str = 'balanced', n_jobs: int = -1):
         """
         Args:
             n_estimators: Number of trees. More = stable but slower (diminishing returns > 100).
             max_depth: Max questions per tree. None = grow until pure. Limit to prevent overfitting.
             class_weight: 'balanced' automatically ups weight for minority class (abandoned).
+            n_jobs: CPU cores for training and large-batch prediction (-1 = all cores).
         """
+        self.n_jobs = n_jobs
         self.feature_names = None
         self.pipeline = Pipeline([
             # 1. Scaler: RF doesn't strictly need this, but good for interpretation & other models
@@ -60,24 +67,33 @@ class RandomForestPredictor:
                 max_features='sqrt',          # Diversity: force trees to look at different features
                 class_weight=class_weight,    # Handle imbalance (few abandoned homes)
                 bootstrap=True,               # Train on random sample with replacement
-                n_jobs=-1,                    # Use all CPU cores
+                n_jobs=None,                  # Cores come from parallel_config() in train/_predict
                 random_state=42               # Reproducibility
             ))
         ])
 
-    def train(self, X_train: pd.DataFrame, y_train: pd.Series, X_val: pd.DataFrame, y_val: pd.Series) -> Dict[str, float]:
+    def train(self, X_train: pd.DataFrame, y_train: pd.Series, X_val: pd.DataFrame, y_val: pd.Series, feature_names: List[str] = None) -> Dict[str, float]:
         """
         Train the forest and validate.
+        
+        X_train/X_val may be DataFrames or plain ndarrays. Feature names are
+        taken from feature_names, else DataFrame columns, else generated.
         """
-        self.feature_names = X_train.columns.tolist()
+        if feature_names is not None:
+            self.feature_names = list(feature_names)
+        elif hasattr(X_train, 'columns'):
+            self.feature_names = X_train.columns.tolist()
+        else:
+            self.feature_names = [f'feature_{i}' for i in range(X_train.shape[1])]
         
         print(f"Training Random Forest on {len(X_train)} samples with {len(self.feature_names)} features...")
-        self.pipeline.fit(X_train, y_train)
+        with parallel_config(n_jobs=getattr(self, 'n_jobs', None)):
+            self.pipeline.fit(X_train, y_train)
         
         # Validation
         print("Validating model...")
-        y_pred = self.pipeline.predict(X_val)
-        y_probs = self.pipeline.predict_proba(X_val)[:, 1]
+        y_pred = self._predict('predict', X_val)
+        y_probs = self._predict('predict_proba', X_val)[:, 1]
         
         metrics = {
             'accuracy': accuracy_score(y_val, y_pred),
@@ -94,7 +110,25 @@ class RandomForestPredictor:
         Get probability predictions [batch_size, 2].
         Returns: 2D array where col 0 is P(Normal), col 1 is P(Abandoned).
         """
-        return self.pipeline.predict_proba(X)
+        return self._predict('predict_proba', X)
+
+    def _predict(self, method: str, X: pd.DataFrame) -> np.ndarray:
+        """
+        Call a pipeline predict method with the core count for this batch.
+        
+        parallel_config() is thread-local, so concurrent callers each get
+        their own setting and the shared fitted forest is never mutated.
+        """
+        with parallel_config(n_jobs=self._n_jobs_for(len(X))):
+            return getattr(self.pipeline, method)(X)
+
+    def _n_jobs_for(self, n_rows: int) -> int:
+        """Small batches run single-threaded to skip joblib pool overhead."""
+        if n_rows < self.PARALLEL_PREDICT_MIN_ROWS:
+            return 1
+        # Models pickled before n_jobs was stored set it on the forest instead,
+        # which takes precedence over parallel_config()
+        return getattr(self, 'n_jobs', None)
 
     def get_feature_importance(self, feature_names: List[str] = None) -> List[Tuple[str, float]]:
         """
@@ -19,7 +19,7 @@ If a location is near an existing cluster of abandoned homes, it's high risk.
 import numpy as np
 import pandas as pd
 from sklearn.cluster import DBSCAN
-from sklearn.neighbors import NearestNeighbors
+from sklearn.neighbors import NearestNeighbors, BallTree
 from sklearn.metrics import silhouette_score
 import matplotlib.pyplot as plt
 from typing import Dict, List, Any, Tuple
@@ -45,15 +45,17 @@ class SpatialClusteringPredictor:
         # Convert eps to radians (required for sklearn haversine)
         self.eps_radians = self.eps_meters / self.EARTH_RADIUS_METERS
         
+        # Neighborhoods are precomputed as a sparse haversine graph in train(),
+        # so DBSCAN only has to walk the graph instead of querying distances.
         self.dbscan = DBSCAN(
             eps=self.eps_radians, 
             min_samples=min_samples, 
-            metric='haversine',
-            algorithm='ball_tree'
+            metric='precomputed'
         )
         
         self.cluster_centroids = None
         self.cluster_sizes = None
+        self._centroid_tree = None
 
     def train(self, coordinates_array: np.ndarray) -> Dict[str, Any]:
         """
@@ -65,8 +67,17 @@ class SpatialClusteringPredictor:
         # Convert to Radians for Haversine
         coords_rad = np.radians(coordinates_array)
         
+        # Build the eps-neighborhood graph once with a haversine Ball Tree
+        # (O(n log n)); only pairs within eps are stored, as a sparse CSR matrix.
+        neighbors = NearestNeighbors(
+            radius=self.eps_radians,
+            metric='haversine',
+            algorithm='ball_tree'
+        ).fit(coords_rad)
+        neighborhood_graph = neighbors.radius_neighbors_graph(coords_rad, mode='distance')
+        
         # Fit
-        self.labels = self.dbscan.fit_predict(coords_rad)
+        self.labels = self.dbscan.fit_predict(neighborhood_graph)
         
         # Analyze Clusters
         # Label -1 is Noise (scattered homes)
@@ -92,6 +103,12 @@ class SpatialClusteringPredictor:
             
         self.cluster_centroids = np.array(self.cluster_centroids)
         
+        # Index centroids once so predict_proba is a single batched tree query
+        self._centroid_tree = (
+            BallTree(np.radians(self.cluster_centroids), metric='haversine')
+            if len(self.cluster_centroids) else None
+        )
+        
         return {
             'n_clusters': n_clusters,
             'n_noise': n_noise,
@@ -114,14 +131,15 @@ class SpatialClusteringPredictor:
             return np.zeros(len(coordinates_array))
             
         # Convert query points to radians
-        query_rad = np.radians(coordinates_array)
-        centroids_rad = np.radians(self.cluster_centroids)
-        
-        # Use NearestNeighbors to find closest cluster center quickly
-        nn = NearestNeighbors(n_neighbors=1, metric='haversine')
-        nn.fit(centroids_rad)
-        
-        distances_rad, indices = nn.kneighbors(query_rad)
+        query_rad = np.radians(np.asarray(coordinates_array))
+        
+        # One vectorized query against the centroid tree built in train().
+        # Models pickled before the tree existed get it built on first use.
+        tree = getattr(self, '_centroid_tree', None)
+        if tree is None:
+            tree = BallTree(np.radians(self.cluster_centroids), metric='haversine')
+            self._centroid_tree = tree
+        distances_rad, _ = tree.query(query_rad, k=1)
         
         # Convert back to meters
         distances_meters = distances_rad * self.EARTH_RADIUS_METERS
@@ -11,14 +11,154 @@ import numpy as np
 import logging
 from typing import List, Tuple, Dict, Optional
 
+# Note: numba is optional. With it, histogram matching of integer rasters
+# runs as a compiled kernel; float input and installs without numba use the
+# np.unique implementation.
+# The kernels below are written as plain Python and wrapped with njit
+# afterwards, so NUMBA_DISABLE_JIT=1 (used for coverage runs) executes the
+# same code uncompiled.
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
 logger = logging.getLogger(__name__)
 
+
+def _starts_new_value(prev: float, value: float) -> bool:
+    """
+    True when value differs from prev in a sorted array.
+    
+    NaNs sort to the end and are grouped as one value, matching np.unique
+    (a plain != would count every NaN nodata pixel separately).
+    """
+    return prev != value and not (prev != prev and value != value)
+
+
+def _unique_counts(sorted_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct values and their counts from an already sorted 1-D array."""
+    n = sorted_values.size
+    values = np.empty(n, dtype=np.float64)
+    counts = np.zeros(n, dtype=np.int64)
+    k = -1
+    for i in range(n):
+        if i == 0 or _starts_new_value(sorted_values[i - 1], sorted_values[i]):
+            k += 1
+            values[k] = sorted_values[i]
+        counts[k] += 1
+    return values[:k + 1], counts[:k + 1]
+
+
+def _reference_cdf(r_sorted: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct reference values and their empirical CDF (value --> quantile)."""
+    r_values, r_counts = _unique_counts(r_sorted)
+    r_quantiles = np.cumsum(r_counts).astype(np.float64)
+    r_quantiles /= r_quantiles[-1]
+    return r_values, r_quantiles
+
+
+def _match_sorted(s_sorted: np.ndarray, order: np.ndarray,
+                  r_values: np.ndarray, r_quantiles: np.ndarray) -> np.ndarray:
+    """
+    Histogram matching core on pre-sorted data.
+    
+    Args:
+        s_sorted: Sorted source pixels (flat float64).
+        order: argsort of the original source, so s_sorted = source[order].
+        r_values, r_quantiles: Reference CDF from _reference_cdf.
+    
+    Builds the source CDF and writes the interpolated values straight
+    back to the source's pixel order in one scan, replacing np.unique's
+    separate mask / inverse-index / counts passes.
+    """
+    s_values, s_counts = _unique_counts(s_sorted)
+    s_quantiles = np.cumsum(s_counts).astype(np.float64)
+    s_quantiles /= s_quantiles[-1]
+    
+    interp_t_values = np.interp(s_quantiles, r_quantiles, r_values)
+    
+    matched = np.empty(s_sorted.size, dtype=np.float64)
+    k = 0
+    for i in range(s_sorted.size):
+        if i > 0 and _starts_new_value(s_sorted[i - 1], s_sorted[i]):
+            k += 1
+        matched[order[i]] = interp_t_values[k]
+    return matched
+
+
+def _match_stack(s_sorted: np.ndarray, orders: np.ndarray,
+                 r_values: np.ndarray, r_quantiles: np.ndarray) -> np.ndarray:
+    """Run _match_sorted over each row (tile) of a 2-D stack."""
+    out = np.empty(s_sorted.shape, dtype=np.float64)
+    for i in prange(s_sorted.shape[0]):
+        out[i] = _match_sorted(s_sorted[i], orders[i], r_values, r_quantiles)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # cache=True stores the compiled code in __pycache__ so only the very
+    # first run pays the compile cost
+    _starts_new_value = njit(cache=True)(_starts_new_value)
+    _unique_counts = njit(cache=True)(_unique_counts)
+    _reference_cdf = njit(cache=True)(_reference_cdf)
+    _match_sorted = njit(cache=True)(_match_sorted)
+    # Tiles are independent, so spread them across cores (GIL released)
+    _match_stack = njit(parallel=True, cache=True)(_match_stack)
+
+
+def _histogram_match_kernel(source: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """
+    Histogram-match flat arrays (any numeric dtype) and return float64.
+    
+    Sorting stays in NumPy (its sorts are several times faster than
+    numba's); the compiled _match_sorted does everything after the sort.
+    The stable argsort is a radix sort for 8/16-bit integers, which is
+    where this beats the np.unique path.
+    """
+    order = np.argsort(source, kind='stable')
+    s_sorted = source[order].astype(np.float64)
+    r_values, r_quantiles = _reference_cdf(np.sort(reference).astype(np.float64))
+    return _match_sorted(s_sorted, order, r_values, r_quantiles)
+
+
+def _use_kernel(*arrays: np.ndarray) -> bool:
+    """
+    True when the numba kernel should replace the np.unique path.
+    
+    Only integer rasters (e.g. uint16 reflectance) are routed to it: for
+    float input the kernel measured no faster than np.unique, while on
+    1000x1000 uint16 tiles it took 40 ms against 100 ms.
+    """
+    return NUMBA_AVAILABLE and all(np.issubdtype(a.dtype, np.integer) for a in arrays)
+
+
+def warmup_jit() -> None:
+    """
+    Compile (or load from the on-disk cache) every numba kernel up front.
+    
+    Call once before the first real histogram_match so it doesn't pay the
+    compile cost; the test suite does this in the session-scoped
+    mosaic_normalizer fixture (tests/conftest.py). No-op without numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    tiny = np.arange(4, dtype=np.float64)
+    _histogram_match_kernel(tiny.astype(np.uint16), tiny.astype(np.uint16))
+    r_values, r_quantiles = _reference_cdf(tiny)
+    _match_stack(tiny.reshape(1, -1), np.arange(4).reshape(1, -1), r_values, r_quantiles)
+
 class MosaicNormalizer:
     """
     Normalizes satellite image tiles using histogram matching and 
     overlap linear regression to create seamless mosaics.
     """
     
+    # Minimum target pixels in a batch before normalize_tiles stacks the
+    # tiles for the parallel kernel (about four 512x512 tiles)
+    STACK_MIN_PIXELS = 1_000_000
+    
     def __init__(self, loess_frac: float = 0.15):
         """
         Initialize the normalizer.
@@ -39,6 +179,10 @@ class MosaicNormalizer:
             return tiles[0]
             
         reference = tiles[0]
+        
+        if self._use_stack(tiles):
+            return self._normalize_stack(tiles)
+        
         normalized_tiles = [reference]
         
         for i in range(1, len(tiles)):
@@ -52,12 +196,57 @@ class MosaicNormalizer:
         # or simplified stictching (e.g. mean)
         return np.array(normalized_tiles)
 
+    def _use_stack(self, tiles: List[np.ndarray]) -> bool:
+        """
+        Whether normalize_tiles should take the _normalize_stack path.
+        
+        Stacking and sorting copy every tile before prange can help, so
+        on a single thread the batch path measured ~40% slower than the
+        per-tile loop. It needs equal-shape integer tiles, more than one
+        numba thread and enough pixels to amortize those copies.
+        """
+        reference = tiles[0]
+        return (
+            _use_kernel(*tiles)
+            and get_num_threads() > 1
+            and all(t.shape == reference.shape for t in tiles)
+            and reference.size * (len(tiles) - 1) >= self.STACK_MIN_PIXELS
+        )
+
+    def _normalize_stack(self, tiles: List[np.ndarray]) -> np.ndarray:
+        """
+        Equal-shape fast path for normalize_tiles.
+        
+        The targets are stacked and sorted in one batched NumPy call, the
+        reference CDF is computed once, and the per-tile matching runs in
+        parallel in the compiled _match_stack kernel.
+        """
+        reference = tiles[0]
+        n_pixels = reference.size
+        
+        stack = np.stack(tiles[1:]).reshape(len(tiles) - 1, n_pixels)
+        orders = np.argsort(stack, axis=1, kind='stable')
+        s_sorted = np.take_along_axis(stack, orders, axis=1).astype(np.float64)
+        r_values, r_quantiles = _reference_cdf(np.sort(reference.ravel()).astype(np.float64))
+        
+        out = np.empty((len(tiles),) + reference.shape, dtype=np.float64)
+        out[0] = reference
+        out[1:] = _match_stack(s_sorted, orders, r_values, r_quantiles).reshape(
+            (len(tiles) - 1,) + reference.shape
+        )
+        return out
+
     def histogram_match(self, source: np.ndarray, reference: np.ndarray) -> np.ndarray:
         """
         Adjust the pixel values of a source image so that its histogram
         matches that of a reference image.
         """
         oldshape = source.shape
+        
+        if _use_kernel(source, reference):
+            matched = _histogram_match_kernel(source.ravel(), reference.ravel())
+            return matched.reshape(oldshape)
+        
         source = source.ravel()
         reference = reference.ravel()
 
@@ -52,6 +52,7 @@ import logging
 from pathlib import Path
 from typing import BinaryIO, Optional, Tuple, Union
 
+import numpy as np
 from PIL import Image, UnidentifiedImageError
 
 # Configure logging
@@ -432,6 +433,68 @@ def get_image_hash(
         return None
 
 
+def get_image_hash_int64(
+    image: Union[Image.Image, Path, str, BinaryIO],
+) -> Optional[np.uint64]:
+    """
+    Calculate a 64-bit difference hash (dHash) packed into an integer.
+
+    Same idea as get_image_hash(image, algorithm='dhash'), but instead of
+    a hex string the 8x8 gradient bitmap is packed into a single np.uint64.
+    Comparing two hashes is then one integer compare, and similarity is a
+    popcount of the XOR (see hash_distance).
+
+    How dHash Works:
+    ---------------
+    1. Convert to grayscale and resize to 9x8
+    2. For each row, compare each pixel with its right neighbour
+    3. The 64 "brighter than neighbour" bits form the hash
+
+    Args:
+        image: PIL Image, path to image, or file-like object.
+
+    Returns:
+        The hash as np.uint64, or None on error.
+
+    Example:
+        ```python
+        hash1 = get_image_hash_int64("photo1.jpg")
+        hash2 = get_image_hash_int64("photo2.jpg")
+        if hash_distance(hash1, hash2) <= 5:
+            print("Images are similar!")
+        ```
+    """
+    try:
+        if isinstance(image, Image.Image):
+            img = image
+        elif isinstance(image, (str, Path)):
+            img = Image.open(image)
+        else:
+            image.seek(0)
+            img = Image.open(image)
+
+        pixels = np.asarray(
+            img.convert('L').resize((9, 8), Image.Resampling.LANCZOS),
+            dtype=np.int16,
+        )
+        bits = pixels[:, 1:] > pixels[:, :-1]
+        return np.frombuffer(np.packbits(bits).tobytes(), dtype='>u8')[0].astype(np.uint64)
+
+    except Exception as e:
+        logger.error(f"Failed to calculate image hash: {e}")
+        return None
+
+
+def hash_distance(hash1: np.uint64, hash2: np.uint64) -> int:
+    """
+    Hamming distance between two get_image_hash_int64 hashes.
+
+    Counts the differing bits with a single XOR + popcount.
+    0 = identical, 64 = completely different.
+    """
+    return int(hash1 ^ hash2).bit_count()
+
+
 def _get_simple_hash(image: Union[Image.Image, Path, str, BinaryIO]) -> Optional[str]:
     """
     Calculate a simple MD5 hash of image bytes (fallback when imagehash unavailable).
@@ -233,6 +233,28 @@ def sample_features() -> Dict[str, float]:
     }
 
 
+@pytest.fixture(scope="session")
+def mosaic_normalizer():
+    """
+    One MosaicNormalizer for the whole session
+    
+    It holds no per-call state, so sharing it is safe and any setup
+    cost is paid once. The numba kernels are compiled here (or loaded from
+    the cache=True on-disk cache) so only processes that run mosaic tests
+    pay the JIT cost, and no single test does.
+    """
+    from backend.ml_pipeline.preprocessing.mosaic_normalizer import MosaicNormalizer, warmup_jit
+    warmup_jit()
+    return MosaicNormalizer()
+
+
+@pytest.fixture(scope="session")
+def satellite_extractor():
+    """One SatelliteExtractor (no credentials) for the whole session"""
+    from backend.ml_pipeline.extractors.satellite_extractor import SatelliteExtractor
+    return SatelliteExtractor()
+
+
 # =============================================================================
 # ASYNC FIXTURES (if using async tests)
 # =============================================================================
@@ -54,6 +54,21 @@ def test_image_rgb():
     return image
 
 
+@pytest.fixture(scope="session")
+def hashed_rgb():
+    """
+    Red test image paired with its precomputed perceptual hash.
+
+    Session scope: the pHash (resize + DCT) is computed once and shared
+    by every hashing test instead of being recomputed per call.
+    Tests must treat the image as read-only.
+    """
+    from backend.services.image_utils import get_image_hash
+
+    image = Image.new('RGB', (100, 100), color='red')
+    return image, get_image_hash(image)
+
+
 @pytest.fixture
 def test_image_with_exif():
     """
@@ -597,28 +612,36 @@ class TestErrorHandling:
 class TestPerceptualHashing:
     """Tests for duplicate detection via perceptual hashing."""
     
-    def test_same_image_same_hash(self, test_image_rgb):
+    def test_same_image_same_hash(self, hashed_rgb):
         """
         Test that the same image produces the same hash.
         """
         from backend.services.image_utils import get_image_hash
-        
-        hash1 = get_image_hash(test_image_rgb)
-        hash2 = get_image_hash(test_image_rgb)
-        
+
+        image, hash1 = hashed_rgb
+        hash2 = get_image_hash(image)
+
         assert hash1 == hash2, "Same image should have same hash"
-    
-    def test_different_images_different_hash(self, test_image_rgb):
+
+    def test_different_images_different_hash(self, hashed_rgb):
         """
         Test that different images (usually) have different hashes.
+        
+        Perceptual hashes ignore colour, so two solid-colour squares hash
+        identically; the second image needs different structure (a
+        half-white square here), not just a different colour.
         """
-        from backend.services.image_utils import get_image_hash
+        from backend.services.image_utils import get_image_hash_int64, hash_distance
         
+        image1, _ = hashed_rgb
         image2 = Image.new('RGB', (100, 100), color='blue')
+        image2.paste((255, 255, 255), (0, 0, 50, 100))
         
-        hash1 = get_image_hash(test_image_rgb)
-        hash2 = get_image_hash(image2)
+        # 64-bit integer hashes compare with a single integer compare
+        hash1 = get_image_hash_int64(image1)
+        hash2 = get_image_hash_int64(image2)
         
         # Note: In theory, different images could have the same hash
         # (collision), but for very different images this is unlikely
         assert hash1 != hash2, "Different images should have different hashes"
+        assert hash_distance(hash1, hash2) > 0
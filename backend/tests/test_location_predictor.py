@@ -5,35 +5,38 @@ Tests for Location Prediction System
 
 import pytest
 import numpy as np
-import pandas as pd
 import shutil
 from pathlib import Path
+from sklearn.metrics import roc_auc_score
 
 from backend.ml_pipeline.models.rf_predictor import RandomForestPredictor
 from backend.ml_pipeline.models.spatial_clustering import SpatialClusteringPredictor
 from backend.ml_pipeline.models.ensemble import EnsemblePredictor
 from backend.ml_pipeline.evaluation.spatial_cv import SpatialCrossValidator
 
+RNG = np.random.default_rng(42)
+FEATURE_COLUMNS = [f'feat_{i}' for i in range(5)]
+
 @pytest.fixture
 def mock_data():
-    # 20 samples, 5 features
-    X = pd.DataFrame(np.random.rand(20, 5), columns=[f'feat_{i}' for i in range(5)])
-    y = np.random.randint(0, 2, 20)
+    # 20 samples, 5 features (plain ndarray; names live in FEATURE_COLUMNS)
+    X = RNG.random((20, 5), dtype=np.float32)
+    y = RNG.integers(0, 2, 20)
     # Coordinates in Detroit
-    lats = np.random.uniform(42.30, 42.40, 20)
-    lons = np.random.uniform(-83.10, -83.00, 20)
+    lats = RNG.uniform(42.30, 42.40, 20)
+    lons = RNG.uniform(-83.10, -83.00, 20)
     coords = np.column_stack([lats, lons])
     return X, y, coords
 
 def test_rf_predictor(mock_data):
     X, y, _ = mock_data
-    rf = RandomForestPredictor(n_estimators=10)
+    rf = RandomForestPredictor(n_estimators=10, n_jobs=1)
     
     # Split
-    X_train, X_val = X.iloc[:15], X.iloc[15:]
+    X_train, X_val = X[:15], X[15:]
     y_train, y_val = y[:15], y[15:]
     
-    metrics = rf.train(X_train, y_train, X_val, y_val)
+    metrics = rf.train(X_train, y_train, X_val, y_val, feature_names=FEATURE_COLUMNS)
     assert 'f1_score' in metrics
     
     probs = rf.predict_proba(X_val)
@@ -41,6 +44,28 @@ def test_rf_predictor(mock_data):
     
     importances = rf.get_feature_importance()
     assert len(importances) == 5
+    assert {name for name, _ in importances} == set(FEATURE_COLUMNS)
+
+def test_rf_predictor_keeps_n_jobs(mock_data, monkeypatch):
+    X, y, _ = mock_data
+    rf = RandomForestPredictor(n_estimators=5, n_jobs=-1)
+    rf_model = rf.pipeline.named_steps['rf']
+    params = rf_model.get_params()
+    
+    # Cores are chosen per call through joblib's thread-local config, so
+    # training and predicting never change the shared forest
+    rf.train(X[:15], y[:15], X[15:], y[15:])
+    rf.predict_proba(X)
+    rf.train(X[:15], y[:15], X[15:], y[15:])
+    assert rf_model.get_params() == params
+    
+    assert rf._n_jobs_for(10) == 1
+    assert rf._n_jobs_for(RandomForestPredictor.PARALLEL_PREDICT_MIN_ROWS) == -1
+    
+    # Models pickled before n_jobs was stored still predict
+    del rf.n_jobs
+    monkeypatch.setattr(RandomForestPredictor, 'PARALLEL_PREDICT_MIN_ROWS', 0)
+    assert rf.predict_proba(X).shape == (20, 2)
 
 def test_spatial_clustering(mock_data):
     _, _, coords = mock_data
@@ -61,11 +86,21 @@ def test_spatial_clustering(mock_data):
     # First 3 should be high probability (part of cluster)
     assert probs[0] > 0.5
 
+def test_spatial_clustering_without_centroid_tree(mock_data):
+    _, _, coords = mock_data
+    model = SpatialClusteringPredictor(eps_meters=2000, min_samples=2)
+    model.train(coords)
+    expected = model.predict_proba(coords)
+    
+    # Models pickled before the centroid tree was cached lack the attribute
+    del model._centroid_tree
+    np.testing.assert_allclose(model.predict_proba(coords), expected)
+
 def test_ensemble(mock_data):
     X, y, coords = mock_data
     
     # Mock trained sub-models (using real classes but lightweight)
-    rf = RandomForestPredictor(n_estimators=5)
+    rf = RandomForestPredictor(n_estimators=5, n_jobs=1)
     rf.train(X, y, X, y) # Cheating for test speed
     
     sp = SpatialClusteringPredictor(min_samples=2)
@@ -82,6 +117,20 @@ def test_ensemble(mock_data):
     assert len(p) == 20
     assert (p >= 0).all() and (p <= 1).all()
 
+def test_batch_roc_auc_matches_sklearn():
+    y = RNG.integers(0, 2, 40)
+    y[:2] = [0, 1]  # both classes present
+    # Coarse scores so every row has plenty of ties
+    scores = RNG.integers(0, 4, (6, 40)) / 4
+    
+    batch = EnsemblePredictor._batch_roc_auc(y, scores)
+    expected = [roc_auc_score(y, row) for row in scores]
+    np.testing.assert_allclose(batch, expected)
+    
+    # AUC is undefined with one class; every row scores 0
+    single = EnsemblePredictor._batch_roc_auc(np.ones(40, dtype=int), scores)
+    assert np.array_equal(single, np.zeros(6))
+
 def test_spatial_cv(mock_data):
     X, y, coords = mock_data
     cv = SpatialCrossValidator(n_splits=2, buffer_distance_km=1)
@@ -92,5 +141,6 @@ def test_spatial_cv(mock_data):
     train_idx, test_idx = splits[0]
     assert len(train_idx) > 0
     assert len(test_idx) > 0
-    # Intersection must be empty
-    assert len(set(train_idx).intersection(set(test_idx))) == 0
+    # Intersection must be empty (indices from np.where are unique and sorted)
+    overlap = np.intersect1d(train_idx, test_idx, assume_unique=True)
+    assert overlap.size == 0
@@ -46,15 +46,15 @@ def set_seeds(seed=42):
 
 import pytest
 import numpy as np
+from scipy.special import expit
 from unittest.mock import Mock, patch, MagicMock
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
-import random
 
-# Set seeds for reproducibility
+# Seed for reproducibility. Every fixture, test and mock builds its own
+# np.random.default_rng(SEED) instead of seeding the global state, so results
+# don't depend on which pytest-xdist worker (or test order) runs them.
 SEED = 42
-random.seed(SEED)
-np.random.seed(SEED)
 
 
 # =============================================================================
@@ -72,10 +72,28 @@ class FeatureVector:
 
 class FeatureEngineering:
     """Mock feature engineering class"""
+
+    # Feature name -> (low, high) range of the mock values
+    FEATURE_RANGES: Dict[str, Tuple[float, float]] = {
+        "building_count": (0, 50),
+        "road_density": (0, 1),
+        "vegetation_index": (-1, 1),
+        "population_density": (0, 10000),
+        "median_income": (20000, 200000),
+        "crime_rate": (0, 100),
+        "vacancy_rate": (0, 0.5),
+        "distance_to_downtown": (0, 50000),
+        "building_age_mean": (10, 100),
+        "property_value_mean": (10000, 500000),
+    }
+    
+    # Features drawn as integers instead of uniform floats
+    COUNT_FEATURES = frozenset({"building_count"})
     
     def __init__(self, use_cache: bool = False):
         self.use_cache = use_cache
         self._cache = {}
+        self._rng = np.random.default_rng(SEED)
     
     def extract_features_for_location(
         self, 
@@ -86,27 +104,40 @@ class FeatureEngineering:
         """Extract features for a location"""
         # Mock feature extraction
         return {
-            "building_count": np.random.randint(0, 50),
-            "road_density": np.random.uniform(0, 1),
-            "vegetation_index": np.random.uniform(-1, 1),
-            "population_density": np.random.uniform(0, 10000),
-            "median_income": np.random.uniform(20000, 200000),
-            "crime_rate": np.random.uniform(0, 100),
-            "vacancy_rate": np.random.uniform(0, 0.5),
-            "distance_to_downtown": np.random.uniform(0, 50000),
-            "building_age_mean": np.random.uniform(10, 100),
-            "property_value_mean": np.random.uniform(10000, 500000),
+            name: (self._rng.integers(low, high) if name in self.COUNT_FEATURES
+                   else self._rng.uniform(low, high))
+            for name, (low, high) in self.FEATURE_RANGES.items()
         }
     
+    def extract_batch_soa(
+        self,
+        locations: List[Tuple[float, float]]
+    ) -> Tuple[np.ndarray, List[str]]:
+        """
+        Extract features for multiple locations as one (N, F) float32 matrix
+        
+        Column-oriented: each feature is drawn for all locations in a single
+        vectorized call, so no per-location dicts are built.
+        """
+        columns = list(self.FEATURE_RANGES)
+        matrix = np.empty((len(locations), len(columns)), dtype=np.float32)
+        for j, (name, (low, high)) in enumerate(self.FEATURE_RANGES.items()):
+            draw = self._rng.integers if name in self.COUNT_FEATURES else self._rng.uniform
+            matrix[:, j] = draw(low, high, len(locations))
+        return matrix, columns
+    
     def extract_batch(
         self, 
         locations: List[Tuple[float, float]]
     ) -> List[Dict[str, float]]:
         """Extract features for multiple locations"""
-        return [
-            self.extract_features_for_location(lat, lon) 
-            for lat, lon in locations
+        matrix, columns = self.extract_batch_soa(locations)
+        # Convert column by column; count features go back to ints
+        values = [
+            (matrix[:, j].astype(np.int64) if name in self.COUNT_FEATURES else matrix[:, j]).tolist()
+            for j, name in enumerate(columns)
         ]
+        return [dict(zip(columns, row)) for row in zip(*values)]
 
 
 class RandomForestPredictor:
@@ -120,8 +151,12 @@ class RandomForestPredictor:
     
     def train(self, X: np.ndarray, y: np.ndarray) -> None:
         """Train the model"""
-        # Simple mock training
-        self._weights = np.random.randn(X.shape[1]) * 0.1
+        # Simple mock training: feature/label correlation plus a little noise
+        X = np.asarray(X, dtype=np.float32)
+        signs = np.where(np.asarray(y) > 0, 1, -1).astype(np.float32)
+        rng = np.random.default_rng(self.random_state)
+        self._weights = X.T @ signs / np.float32(len(signs))
+        self._weights += rng.standard_normal(X.shape[1], dtype=np.float32) * np.float32(0.01)
         self._is_trained = True
     
     def predict(self, X: np.ndarray) -> np.ndarray:
@@ -129,51 +164,71 @@ class RandomForestPredictor:
         if not self._is_trained:
             raise RuntimeError("Model not trained")
         
-        # Mock prediction (linear + noise)
+        # Mock prediction (linear + noise), float32 end to end
+        # Reinterpret the bool mask as int8 instead of copying via astype
+        X = np.asarray(X, dtype=np.float32)
         scores = X @ self._weights
-        return (scores > 0).astype(int)
-    
+        return (scores > 0).view(np.int8)
+
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
         """Get prediction probabilities"""
         if not self._is_trained:
             raise RuntimeError("Model not trained")
-        
-        scores = X @ self._weights
-        probs = 1 / (1 + np.exp(-scores))  # Sigmoid
-        return np.column_stack([1 - probs, probs])
+
+        # Sigmoid computed in place inside one float32 (n, 2) output buffer;
+        # expit is a single numerically stable logistic pass
+        X = np.asarray(X, dtype=np.float32)
+        out = np.empty((X.shape[0], 2), dtype=np.float32)
+        probs = out[:, 1]
+        np.matmul(X, self._weights, out=probs)
+        expit(probs, out=probs)
+        np.subtract(1.0, probs, out=out[:, 0])
+        return out
     
     def score(self, X: np.ndarray, y: np.ndarray) -> float:
         """Calculate accuracy score"""
         predictions = self.predict(X)
-        return np.mean(predictions == y)
+        return np.count_nonzero(predictions == y) / y.size
 
 
 class ImageClassifier:
     """Mock image classifier"""
-    
+
+    # Mock heatmap drawn once and shared read-only across all instances
+    _GRADCAM_CACHE: Optional[np.ndarray] = None
+
     def __init__(self, model_name: str = 'resnet50', pretrained: bool = True):
         self.model_name = model_name
         self.pretrained = pretrained
         self._is_loaded = False
+        self._rng = np.random.default_rng(SEED)
     
     def load(self) -> None:
         """Load the model"""
         self._is_loaded = True
     
     def predict(self, image: np.ndarray) -> Tuple[int, float]:
-        """Predict if image shows abandoned building"""
+        """
+        Predict if image shows abandoned building
+
+        Accepts uint8 (0-255) or float (0-1) pixel arrays.
+        """
         if not self._is_loaded:
             self.load()
         
         # Mock prediction
-        confidence = np.random.uniform(0.5, 1.0)
+        confidence = self._rng.uniform(0.5, 1.0)
         prediction = 1 if confidence > 0.7 else 0
         return prediction, float(confidence)
     
     def get_gradcam(self, image: np.ndarray) -> np.ndarray:
         """Generate GradCAM heatmap for interpretability"""
-        # Return mock heatmap
-        return np.random.rand(224, 224)
+        # Return mock heatmap (callers that need to mutate it must .copy())
+        if ImageClassifier._GRADCAM_CACHE is None:
+            heatmap = np.random.default_rng(SEED).random((224, 224), dtype=np.float32)
+            heatmap.setflags(write=False)
+            ImageClassifier._GRADCAM_CACHE = heatmap
+        return ImageClassifier._GRADCAM_CACHE
 
 
 # =============================================================================
@@ -181,38 +236,86 @@ class ImageClassifier:
 # =============================================================================
 
 @pytest.fixture
+def rng():
+    """Freshly seeded random generator, private to each test"""
+    return np.random.default_rng(SEED)
+
+
+@pytest.fixture(scope="session")
+def make_dataset():
+    """
+    Factory for cached (X, y) training data
+    
+    Session scope: each (n_samples, n_features, seed) dataset is generated
+    once and shared read-only, so tests don't redo the PRNG work.
+    Labels follow the simple rule y = X[:, 0] > 0.
+    """
+    cache = {}
+    
+    def _make(n_samples: int, n_features: int, seed: int = SEED) -> Tuple[np.ndarray, np.ndarray]:
+        key = (n_samples, n_features, seed)
+        if key not in cache:
+            rng = np.random.default_rng(seed)
+            X = rng.standard_normal((n_samples, n_features), dtype=np.float32)
+            y = (X[:, 0] > 0).astype(np.int8)
+            X.setflags(write=False)
+            y.setflags(write=False)
+            cache[key] = (X, y)
+        return cache[key]
+    
+    return _make
+
+
+@pytest.fixture(scope="module")
 def feature_engineer():
     """Feature engineering instance with caching enabled"""
     fe = FeatureEngineering(use_cache=True)
     return fe
 
 
-@pytest.fixture
-def trained_model():
-    """Pre-trained random forest model"""
-    np.random.seed(SEED)
-    
+@pytest.fixture(scope="module")
+def trained_model(make_dataset):
+    """
+    Pre-trained random forest model
+
+    Module scope: trained once and shared; tests must treat it as read-only
+    (predict / predict_proba / score only).
+    """
     model = RandomForestPredictor(n_estimators=10, random_state=SEED)
     
-    # Create training data
-    X_train = np.random.randn(100, 10)
-    y_train = (X_train[:, 0] > 0).astype(int)  # Simple rule for labels
+    # Create training data (labels follow a simple rule: X[:, 0] > 0)
+    X_train, y_train = make_dataset(100, 10)
     
     model.train(X_train, y_train)
     return model
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def image_classifier():
-    """Image classifier instance"""
-    return ImageClassifier(model_name='resnet50', pretrained=False)
+    """
+    Image classifier instance, loaded once up front
+
+    Module scope: load() is the expensive step for a real model, so it is
+    paid once here instead of lazily in every test. Tests that need to
+    observe lazy loading should use fresh_image_classifier instead.
+    """
+    classifier = ImageClassifier(model_name='resnet50', pretrained=False)
+    classifier.load()
+    return classifier
 
 
 @pytest.fixture
+def fresh_image_classifier():
+    """Unloaded image classifier instance (function scope)"""
+    return ImageClassifier(model_name='resnet50', pretrained=False)
+
+
+@pytest.fixture(scope="module")
 def sample_image():
     """Sample image data for testing"""
-    # Create a mock image (3 channels, 224x224)
-    return np.random.rand(224, 224, 3).astype(np.float32)
+    # Create a mock image (3 channels, 224x224) as raw uint8 pixels
+    rng = np.random.default_rng(SEED)
+    return rng.integers(0, 256, (224, 224, 3), dtype=np.uint8)
 
 
 # =============================================================================
@@ -273,30 +376,41 @@ class TestFeatureEngineering:
         
         assert len(results) == 3
         assert all(isinstance(r, dict) for r in results)
+        assert all(isinstance(r["building_count"], int) for r in results)
+    
+    def test_batch_extraction_soa(self, feature_engineer):
+        """Test columnar batch extraction returns one float32 matrix"""
+        locations = [(42.33, -83.04), (42.34, -83.05)]
+        
+        matrix, columns = feature_engineer.extract_batch_soa(locations)
+        
+        assert matrix.shape == (2, len(columns))
+        assert matrix.dtype == np.float32
+        assert columns[0] == "building_count"
 
 
 # =============================================================================
 # MODEL TRAINING TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group("rf")
 class TestRandomForestPredictor:
     """Tests for the random forest predictor"""
     
-    def test_untrained_model_raises_error(self):
+    def test_untrained_model_raises_error(self, make_dataset):
         """Test that prediction on untrained model raises error"""
         model = RandomForestPredictor()
-        X = np.random.randn(10, 5)
+        X, _ = make_dataset(10, 5)
         
         with pytest.raises(RuntimeError) as exc_info:
             model.predict(X)
         
         assert "not trained" in str(exc_info.value).lower()
     
-    def test_train_sets_trained_flag(self):
+    def test_train_sets_trained_flag(self, make_dataset):
         """Test that training sets the trained flag"""
         model = RandomForestPredictor()
-        X_train = np.random.randn(50, 10)
-        y_train = np.random.randint(0, 2, 50)
+        X_train, y_train = make_dataset(50, 10)
         
         assert model._is_trained == False
         
@@ -304,42 +418,42 @@ class TestRandomForestPredictor:
         
         assert model._is_trained == True
     
-    def test_prediction_shape(self, trained_model):
+    def test_prediction_shape(self, trained_model, make_dataset):
         """Test that predictions have correct shape"""
-        X_test = np.random.randn(20, 10)
+        X_test, _ = make_dataset(20, 10)
         
         predictions = trained_model.predict(X_test)
         
         assert predictions.shape == (20,)
     
-    def test_predictions_are_binary(self, trained_model):
+    def test_predictions_are_binary(self, trained_model, make_dataset):
         """Test that predictions are 0 or 1"""
-        X_test = np.random.randn(20, 10)
+        X_test, _ = make_dataset(20, 10)
         
         predictions = trained_model.predict(X_test)
         
         assert set(predictions).issubset({0, 1})
     
-    def test_predict_proba_shape(self, trained_model):
+    def test_predict_proba_shape(self, trained_model, make_dataset):
         """Test probability predictions shape"""
-        X_test = np.random.randn(20, 10)
+        X_test, _ = make_dataset(20, 10)
         
         probs = trained_model.predict_proba(X_test)
         
         assert probs.shape == (20, 2)  # 2 classes
     
-    def test_probabilities_sum_to_one(self, trained_model):
+    def test_probabilities_sum_to_one(self, trained_model, make_dataset):
         """Test that class probabilities sum to 1"""
-        X_test = np.random.randn(20, 10)
+        X_test, _ = make_dataset(20, 10)
         
         probs = trained_model.predict_proba(X_test)
         
-        row_sums = probs.sum(axis=1)
-        np.testing.assert_array_almost_equal(row_sums, np.ones(20))
+        row_sums = probs.sum(axis=1, dtype=np.float32)
+        assert np.allclose(row_sums, 1.0, atol=1e-6)
     
-    def test_probabilities_in_valid_range(self, trained_model):
+    def test_probabilities_in_valid_range(self, trained_model, make_dataset):
         """Test that probabilities are between 0 and 1"""
-        X_test = np.random.randn(20, 10)
+        X_test, _ = make_dataset(20, 10)
         
         probs = trained_model.predict_proba(X_test)
         
@@ -356,13 +470,11 @@ class TestModelTrainingPerformance:
     Skip with: pytest -m "not slow"
     """
     
-    def test_training_improves_performance(self):
+    def test_training_improves_performance(self, make_dataset):
         """Test that training improves model performance"""
-        np.random.seed(SEED)
-        
         # Create dataset
-        X = np.random.randn(200, 10)
-        y = (X[:, 0] + X[:, 1] > 0).astype(int)  # Learnable pattern
+        X, _ = make_dataset(200, 10)
+        y = (X[:, 0] + X[:, 1] > 0).astype(np.int8)  # Learnable pattern
         
         # Split
         X_train, X_test = X[:150], X[150:]
@@ -386,6 +498,14 @@ class TestModelTrainingPerformance:
 class TestImageClassifier:
     """Tests for image classification"""
     
+    def test_predict_lazily_loads_model(self, fresh_image_classifier, sample_image):
+        """Test that predict loads the model on first use"""
+        assert fresh_image_classifier._is_loaded == False
+        
+        fresh_image_classifier.predict(sample_image)
+        
+        assert fresh_image_classifier._is_loaded == True
+    
     def test_prediction_format(self, image_classifier, sample_image):
         """Test that prediction returns expected format"""
         prediction, confidence = image_classifier.predict(sample_image)
@@ -478,12 +598,9 @@ class TestWithMocking:
     (100, 10),
     (200, 20),
 ])
-def test_model_handles_different_data_sizes(n_samples, n_features):
+def test_model_handles_different_data_sizes(n_samples, n_features, make_dataset):
     """Test model works with different data dimensions"""
-    np.random.seed(SEED)
-    
-    X = np.random.randn(n_samples, n_features)
-    y = np.random.randint(0, 2, n_samples)
+    X, y = make_dataset(n_samples, n_features)
     
     model = RandomForestPredictor(random_state=SEED)
     model.train(X, y)
@@ -498,10 +615,10 @@ def test_model_handles_different_data_sizes(n_samples, n_features):
     (256, 256, 3),
     (512, 512, 3),
 ])
-def test_classifier_handles_different_image_sizes(image_size):
+def test_classifier_handles_different_image_sizes(image_size, rng):
     """Test classifier with various image sizes"""
     classifier = ImageClassifier()
-    image = np.random.rand(*image_size).astype(np.float32)
+    image = rng.integers(0, 256, image_size, dtype=np.uint8)
     
     prediction, confidence = classifier.predict(image)
     
@@ -97,7 +97,7 @@ class Location:
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_location():
     """
     Fixture: Reusable test data
@@ -113,6 +113,10 @@ def sample_location():
     - class: Run once per test class
     - module: Run once per file
     - session: Run once for entire test session
+    
+    The location fixtures here are session-scoped: tests only read them,
+    so one instance each is shared. A test that MUTATES a location must
+    build its own Location instead of modifying a shared one.
     """
     return Location(
         latitude=42.3314,
@@ -125,7 +129,7 @@ def sample_location():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def abandoned_location():
     """Fixture for a confirmed abandoned location"""
     return Location(
@@ -139,7 +143,7 @@ def abandoned_location():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def intact_location():
     """Fixture for a non-abandoned location"""
     return Location(
@@ -208,43 +212,25 @@ class TestLocationValidation:
     - Protects data integrity
     """
     
-    def test_invalid_condition_raises_error(self):
-        """Test that invalid condition values are rejected"""
-        with pytest.raises(ValueError) as exc_info:
-            Location(
-                latitude=42.0,
-                longitude=-83.0,
-                condition="invalid_value"
-            )
-        
-        # Check error message contains useful info
-        assert "condition" in str(exc_info.value).lower()
-    
-    def test_invalid_accessibility_raises_error(self):
-        """Test that invalid accessibility values are rejected"""
-        with pytest.raises(ValueError):
-            Location(
-                latitude=42.0,
-                longitude=-83.0,
-                accessibility="impossible"
-            )
-    
-    def test_latitude_out_of_range_high(self):
-        """Test latitude > 90 is rejected"""
+    @pytest.mark.parametrize("kwargs,field", [
+        ({"latitude": 42.0, "longitude": -83.0, "condition": "invalid_value"}, "condition"),
+        ({"latitude": 42.0, "longitude": -83.0, "accessibility": "impossible"}, "accessibility"),
+        ({"latitude": 100, "longitude": -83.0}, "latitude"),
+        ({"latitude": -100, "longitude": -83.0}, "latitude"),
+        ({"latitude": 42.0, "longitude": 200}, "longitude"),
+    ], ids=[
+        "invalid_condition",
+        "invalid_accessibility",
+        "latitude_too_high",
+        "latitude_too_low",
+        "longitude_out_of_range",
+    ])
+    def test_invalid_values_raise_error(self, kwargs, field):
+        """Invalid values are rejected, and the error names the bad field"""
         with pytest.raises(ValueError) as exc_info:
-            Location(latitude=100, longitude=-83.0)
+            Location(**kwargs)
         
-        assert "latitude" in str(exc_info.value).lower()
-    
-    def test_latitude_out_of_range_low(self):
-        """Test latitude < -90 is rejected"""
-        with pytest.raises(ValueError):
-            Location(latitude=-100, longitude=-83.0)
-    
-    def test_longitude_out_of_range(self):
-        """Test longitude outside -180 to 180 is rejected"""
-        with pytest.raises(ValueError):
-            Location(latitude=42.0, longitude=200)
+        assert field in str(exc_info.value).lower()
 
 
 # =============================================================================
@@ -344,15 +330,20 @@ def test_marked_as_unit():
 
 
 @pytest.mark.slow
-def test_marked_as_slow():
+def test_marked_as_slow(monkeypatch):
     """
     Mark slow tests to skip during rapid development
     
     Run all tests: pytest
     Skip slow tests: pytest -m "not slow"
     Only slow tests: pytest -m slow
+    
+    This test only demonstrates the marker, so time.sleep is patched out
+    with monkeypatch (undone automatically after the test) rather than
+    actually waiting.
     """
     import time
+    monkeypatch.setattr(time, "sleep", lambda *_: None)
     time.sleep(0.1)  # Simulate slow operation
     assert True
 
@@ -4,13 +4,31 @@ Tests for Mosaic Normalizer
 """
 import pytest
 import numpy as np
-from backend.ml_pipeline.preprocessing.mosaic_normalizer import MosaicNormalizer
+from backend.ml_pipeline.preprocessing import mosaic_normalizer as mosaic_module
 
-def test_histogram_match_shape():
-    norm = MosaicNormalizer()
+# Keep the numba-backed tests on one xdist worker (--dist loadgroup) so only
+# that worker requests the mosaic_normalizer fixture, which compiles the JIT
+# kernels. Under NUMBA_DISABLE_JIT=1 (the CI coverage run) there is nothing
+# to compile and the grouping only keeps these tests together.
+pytestmark = pytest.mark.xdist_group("numba")
+
+
+@pytest.fixture(scope="session")
+def rng():
+    """
+    One seeded Generator shared by these tests
+    
+    Deterministic data without touching the legacy global np.random state;
+    every xdist worker builds its own instance.
+    """
+    return np.random.default_rng(0)
+
+
+def test_histogram_match_shape(mosaic_normalizer, rng):
+    norm = mosaic_normalizer
     
-    source = np.random.rand(100, 100)
-    ref = np.random.rand(100, 100)
+    source = rng.random((100, 100))
+    ref = rng.random((100, 100))
     
     matched = norm.histogram_match(source, ref)
     
@@ -19,8 +37,8 @@ def test_histogram_match_shape():
     assert matched.min() >= ref.min() - 0.1 # approximate
     assert matched.max() <= ref.max() + 0.1
 
-def test_normalize_tiles():
-    norm = MosaicNormalizer()
+def test_normalize_tiles(mosaic_normalizer):
+    norm = mosaic_normalizer
     
     t1 = np.ones((10, 10)) * 0.5
     t2 = np.ones((10, 10)) * 0.8 # Brighter
@@ -35,3 +53,31 @@ def test_normalize_tiles():
     # Second should be closer to first (0.5)
     # Since t1 is uniform 0.5, t2 should map to 0.5
     assert np.allclose(normalized[1], 0.5)
+
+def test_kernel_matches_numpy_fallback(monkeypatch, mosaic_normalizer, rng):
+    # Runs the compiled kernels normally, and their pure-Python bodies
+    # under NUMBA_DISABLE_JIT=1 - both must agree with the np.unique path
+    norm = mosaic_normalizer
+    
+    # Integer rasters take the kernel path
+    tiles = [rng.integers(0, 16, (20, 20)).astype(np.uint16) for _ in range(3)]
+    expected = [norm.histogram_match(t, tiles[0]) for t in tiles[1:]]
+    
+    # NaN nodata pixels (e.g. from mask_scl_array) group as one value, like
+    # np.unique; float input normally skips the kernel, so call it directly
+    nan_source = tiles[1].astype(np.float64)
+    nan_source[rng.random((20, 20)) < 0.1] = np.nan
+    nan_reference = tiles[0].astype(np.float64)
+    nan_reference[:2, :2] = np.nan
+    nan_expected = mosaic_module._histogram_match_kernel(nan_source.ravel(), nan_reference.ravel())
+    
+    monkeypatch.setattr(mosaic_module, "NUMBA_AVAILABLE", False)
+    fallback = [norm.histogram_match(t, tiles[0]) for t in tiles[1:]]
+    fallback_tiles = norm.normalize_tiles(tiles)
+    nan_fallback = norm.histogram_match(nan_source, nan_reference).ravel()
+    monkeypatch.undo()
+    
+    assert all(np.array_equal(a, b) for a, b in zip(expected, fallback))
+    # Called directly: normalize_tiles only batches large multi-threaded runs
+    assert np.array_equal(norm._normalize_stack(tiles), fallback_tiles)
+    assert np.array_equal(nan_expected, nan_fallback, equal_nan=True)
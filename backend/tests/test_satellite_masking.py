@@ -2,11 +2,11 @@
 Tests for Satellite Masking
 ==========================
 """
+import numpy as np
 import pytest
-from backend.ml_pipeline.extractors.satellite_extractor import SatelliteExtractor
 
-def test_mask_clouds_and_shadows():
-    extractor = SatelliteExtractor()
+def test_mask_clouds_and_shadows(satellite_extractor):
+    extractor = satellite_extractor
     
     mock_bands = {'ndvi_mean': 0.5, 'ndbi_mean': -0.1}
     
@@ -27,3 +27,19 @@ def test_mask_clouds_and_shadows():
     # 4. Water (SCL=6)
     res_water = extractor.mask_clouds_and_shadows(mock_bands.copy(), 6)
     assert res_water['ndvi_mean'] is None
+    
+    # 5. Float codes, as read from masked rasters
+    assert extractor.mask_clouds_and_shadows(mock_bands.copy(), 3.0)['ndvi_mean'] is None
+    assert extractor.mask_clouds_and_shadows(mock_bands.copy(), np.float32(4.0))['ndvi_mean'] == 0.5
+    assert extractor.mask_clouds_and_shadows(mock_bands.copy(), float('nan'))['ndvi_mean'] == 0.5
+
+def test_mask_scl_array(satellite_extractor):
+    extractor = satellite_extractor
+    
+    ndvi = np.array([[0.5, 0.4], [0.3, 0.2]])
+    scl = np.array([[4, 3], [9, 5]], dtype=np.uint8)
+    
+    masked = extractor.mask_scl_array(ndvi, scl)
+    assert np.array_equal(np.isnan(masked), [[False, True], [True, False]])
+    assert masked[0, 0] == 0.5
+    assert masked[1, 1] == 0.2
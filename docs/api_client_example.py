@@ -27,9 +27,44 @@ import requests
 from typing import Optional, List, Dict, Any, Union
 from dataclasses import dataclass
 from datetime import datetime
+import asyncio
+import random
+import sys
+import threading
 import time
 import logging
 
+# orjson parses straight from bytes in C and is several times faster than
+# the stdlib on large location lists; fall back to json when not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# ciso8601 is a C ISO-8601 parser; otherwise use fromisoformat, which
+# only understands a trailing 'Z' from Python 3.11 on
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_dt = datetime.fromisoformat
+    else:
+        def _parse_dt(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# httpx is only needed for AsyncAbandonedHomesClient
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -80,13 +115,36 @@ class ServerError(APIError):
     pass
 
 
+def _backoff_delay(retry_delay: float, attempts: int, cap: float) -> float:
+    """
+    "Full jitter" exponential backoff: a random delay in [0, base * 2^attempts],
+    capped. The randomness spreads retries out so many clients that failed
+    together don't all hammer the server again at the same instant.
+    """
+    return min(retry_delay * (2 ** attempts), cap) * random.random()
+
+
+# Status code --> exception class (429 is handled separately, 5xx by range)
+_STATUS_EXC = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+}
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Location:
-    """Location data model"""
+    """
+    Location data model
+    
+    slots=True drops the per-instance __dict__, which matters when a list
+    endpoint returns thousands of these; frozen=True makes them read-only.
+    """
     id: str
     latitude: float
     longitude: float
@@ -112,9 +170,43 @@ class Location:
             accessibility=data.get('accessibility', 'moderate'),
             notes=data.get('notes'),
             confidence_score=data.get('confidence_score'),
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
+            created_at=_parse_dt(data['created_at']),
+            updated_at=_parse_dt(data['updated_at'])
         )
+    
+    @classmethod
+    def from_many(cls, rows: List[Dict[str, Any]]) -> List['Location']:
+        """
+        Create Locations from a list of API response dicts.
+        
+        Same result as [Location.from_dict(r) for r in rows], but the bound
+        from_dict is looked up once instead of once per row.
+        """
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
+
+
+def _location_params(
+    skip: int,
+    limit: int,
+    confirmed_only: bool,
+    condition: Optional[str],
+    min_confidence: Optional[float],
+    bbox: Optional[str]
+) -> Dict[str, Any]:
+    """Build the query string for GET /locations/ (shared by both clients)"""
+    params = {'skip': skip, 'limit': limit}
+    
+    if confirmed_only:
+        params['confirmed_only'] = 'true'
+    if condition:
+        params['condition'] = condition
+    if min_confidence:
+        params['min_confidence'] = min_confidence
+    if bbox:
+        params['bbox'] = bbox
+    
+    return params
 
 
 @dataclass
@@ -125,6 +217,23 @@ class PredictionJob:
     progress: float = 0.0
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PredictionJob':
+        """Create PredictionJob from API response dict"""
+        return cls(
+            job_id=data['job_id'],
+            status=data['status'],
+            progress=data.get('progress', 0),
+            result=data.get('result'),
+            error=data.get('error')
+        )
+
+
+def _poll_delay(attempt: int, poll_interval: float) -> float:
+    """Poll schedule 0.5, 1, 2, 4, ... seconds, capped at poll_interval"""
+    # Clamp the exponent: 2 ** 1024 no longer converts to a float
+    return min(poll_interval, 0.5 * 2 ** min(attempt, 16))
 
 
 # =============================================================================
@@ -177,7 +286,8 @@ class AbandonedHomesClient:
         api_key: str,
         timeout: int = 30,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0
     ):
         """
         Initialize the API client.
@@ -187,13 +297,22 @@ class AbandonedHomesClient:
             api_key: Your API key
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
-            retry_delay: Initial retry delay (doubles each retry)
+            retry_delay: Initial retry delay (doubles each retry, jittered)
+            max_retry_delay: Upper bound for any single wait, including
+                             a server-supplied Retry-After
         """
         self.base_url = base_url.rstrip('/')
+        self._api_root = f"{self.base_url}/api/v1"  # Prefix of every endpoint URL
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        
+        # Waits go through Event.wait instead of time.sleep so close() can
+        # interrupt a thread that is backing off (wait returns True then)
+        self._stop = threading.Event()
+        self._sleep = self._stop.wait
         
         # Create session for connection pooling
         # EDUCATIONAL: Session Benefits
@@ -206,6 +325,14 @@ class AbandonedHomesClient:
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        
+        # Per-request override for file uploads, built once. requests merges
+        # request headers over the session's and drops keys set to None, so
+        # this removes the JSON Content-Type and lets requests generate
+        # multipart/form-data with its boundary. (Passing a copy of the
+        # session headers without the key doesn't work - the session value
+        # gets merged back in.)
+        self._multipart_headers = {'Content-Type': None}
     
     def _request(
         self,
@@ -214,11 +341,16 @@ class AbandonedHomesClient:
         params: dict = None,
         data: dict = None,
         files: dict = None,
-        retry: bool = True
-    ) -> Dict[str, Any]:
+        retry: bool = True,
+        extra_headers: dict = None,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], requests.Response]:
         """
         Make an API request with error handling and retries.
         
+        Pass raw=True to get the checked Response itself (e.g. to read its
+        headers) instead of the parsed JSON body.
+        
         EDUCATIONAL: Robust Request Handling
         -----------------------------------
         Steps:
@@ -229,7 +361,7 @@ class AbandonedHomesClient:
         5. Retry if appropriate (network errors, 5xx)
         6. Parse and return JSON
         """
-        url = f"{self.base_url}/api/v1{endpoint}"
+        url = self._api_root + endpoint
         
         attempts = 0
         last_error = None
@@ -247,16 +379,18 @@ class AbandonedHomesClient:
                     kwargs['params'] = params
                 
                 if data and not files:
-                    kwargs['json'] = data
+                    # Session headers already declare application/json
+                    kwargs['data'] = _json_dumps(data)
                 elif files:
                     # Remove Content-Type for multipart
-                    headers = dict(self.session.headers)
-                    del headers['Content-Type']
-                    kwargs['headers'] = headers
+                    kwargs['headers'] = self._multipart_headers
                     kwargs['files'] = files
                     if data:
                         kwargs['data'] = data
                 
+                if extra_headers:
+                    kwargs['headers'] = {**kwargs.get('headers', {}), **extra_headers}
+                
                 # Make request
                 response = self.session.request(method, url, **kwargs)
                 
@@ -264,10 +398,11 @@ class AbandonedHomesClient:
                 
                 # Handle rate limiting
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
+                    retry_after = min(int(response.headers.get('Retry-After', 60)), self.max_retry_delay)
                     if retry and attempts < self.max_retries:
                         logger.warning(f"Rate limited. Waiting {retry_after}s...")
-                        time.sleep(retry_after)
+                        if self._sleep(retry_after):
+                            raise APIError("Client closed")
                         attempts += 1
                         continue
                     raise RateLimitError(
@@ -279,18 +414,22 @@ class AbandonedHomesClient:
                 # Handle errors
                 self._handle_error(response)
                 
+                if raw:
+                    return response
+                
                 # Return JSON or empty dict
-                if response.status_code == 204:
+                if response.status_code == 204 or not response.content:
                     return {}
-                return response.json()
+                return _json_loads(response.content)
                 
             except requests.exceptions.RequestException as e:
                 # Network error - retry
                 last_error = e
                 if retry and attempts < self.max_retries:
-                    delay = self.retry_delay * (2 ** attempts)  # Exponential backoff
-                    logger.warning(f"Request failed: {e}. Retrying in {delay}s...")
-                    time.sleep(delay)
+                    delay = _backoff_delay(self.retry_delay, attempts, self.max_retry_delay)
+                    logger.warning(f"Request failed: {e}. Retrying in {delay:.2f}s...")
+                    if self._sleep(delay):
+                        raise APIError("Client closed")
                     attempts += 1
                     continue
                 raise APIError(f"Network error: {e}")
@@ -311,27 +450,31 @@ class AbandonedHomesClient:
         - 429: Rate limit (handled separately)
         - 5xx: Server error (not client's fault)
         """
-        if response.status_code < 400:
+        status_code = response.status_code
+        if status_code < 400:
             return  # No error
         
-        try:
-            error_data = response.json()
-            message = error_data.get('detail', str(error_data))
-        except:
-            message = response.text or f"HTTP {response.status_code}"
-        
-        if response.status_code == 400:
-            raise ValidationError(message, status_code=400)
-        elif response.status_code == 401:
-            raise AuthenticationError(message, status_code=401)
-        elif response.status_code == 403:
-            raise AuthorizationError(message, status_code=403)
-        elif response.status_code == 404:
-            raise NotFoundError(message, status_code=404)
-        elif response.status_code >= 500:
-            raise ServerError(message, status_code=response.status_code)
-        else:
-            raise APIError(message, status_code=response.status_code)
+        # Only try to parse JSON bodies; proxies often return plain-text/HTML errors
+        message = response.text or f"HTTP {status_code}"
+        if response.headers.get('content-type', '').startswith('application/json'):
+            try:
+                error_data = _json_loads(response.content)
+                message = error_data.get('detail', str(error_data))
+            except (ValueError, AttributeError):
+                pass
+        
+        exc = _STATUS_EXC.get(status_code) or (ServerError if status_code >= 500 else APIError)
+        raise exc(message, status_code=status_code)
+    
+    def close(self) -> None:
+        """
+        Shut the client down.
+        
+        Safe to call from another thread: any request currently waiting out
+        a backoff wakes up immediately and raises APIError.
+        """
+        self._stop.set()
+        self.session.close()
     
     # =========================================================================
     # HEALTH
@@ -414,19 +557,10 @@ class AbandonedHomesClient:
         Returns:
             List of Location objects
         """
-        params = {'skip': skip, 'limit': limit}
-        
-        if confirmed_only:
-            params['confirmed_only'] = 'true'
-        if condition:
-            params['condition'] = condition
-        if min_confidence:
-            params['min_confidence'] = min_confidence
-        if bbox:
-            params['bbox'] = bbox
+        params = _location_params(skip, limit, confirmed_only, condition, min_confidence, bbox)
         
         response = self._request('GET', '/locations/', params=params)
-        return [Location.from_dict(loc) for loc in response.get('items', [])]
+        return Location.from_many(response.get('items', []))
     
     def delete_location(self, location_id: str) -> None:
         """Delete a location"""
@@ -479,13 +613,7 @@ class AbandonedHomesClient:
     def get_prediction_status(self, job_id: str) -> PredictionJob:
         """Get prediction job status"""
         response = self._request('GET', f'/predictions/{job_id}')
-        return PredictionJob(
-            job_id=response['job_id'],
-            status=response['status'],
-            progress=response.get('progress', 0),
-            result=response.get('result'),
-            error=response.get('error')
-        )
+        return PredictionJob.from_dict(response)
     
     def wait_for_prediction(
         self,
@@ -504,18 +632,36 @@ class AbandonedHomesClient:
         3. Stop when status is terminal (completed/failed)
         4. Handle timeout
         
+        Two refinements:
+        - Exponential poll schedule (0.5s, 1s, 2s, ... up to poll_interval):
+          short jobs are noticed quickly, long jobs aren't polled hard.
+        - Conditional requests: we send back the ETag of the last status as
+          If-None-Match, so an unchanged job costs the server a bodyless
+          304. Servers that ignore the header just return 200 as before.
+        
         Args:
             job_id: Job ID to wait for
-            poll_interval: Seconds between status checks
+            poll_interval: Longest wait between status checks
             timeout: Max seconds to wait
             
         Returns:
             Final job status
         """
         start_time = time.time()
+        endpoint = f'/predictions/{job_id}'
+        status = None
+        etag = None
+        attempt = 0
         
         while True:
-            status = self.get_prediction_status(job_id)
+            response = self._request(
+                'GET', endpoint,
+                extra_headers={'If-None-Match': etag} if etag else None,
+                raw=True
+            )
+            if response.status_code != 304 or status is None:
+                status = PredictionJob.from_dict(_json_loads(response.content))
+                etag = response.headers.get('ETag')
             
             if status.status in ('completed', 'failed'):
                 return status
@@ -525,7 +671,9 @@ class AbandonedHomesClient:
                 raise TimeoutError(f"Prediction job {job_id} timed out after {timeout}s")
             
             logger.info(f"Job {job_id}: {status.status} ({status.progress:.0%})")
-            time.sleep(poll_interval)
+            if self._sleep(_poll_delay(attempt, poll_interval)):
+                raise APIError("Client closed")
+            attempt += 1
     
     # =========================================================================
     # ADMIN
@@ -540,6 +688,246 @@ class AbandonedHomesClient:
         return self._request('GET', '/admin/models')
 
 
+class AsyncAbandonedHomesClient:
+    """
+    asyncio version of AbandonedHomesClient built on httpx.AsyncClient.
+    
+    EDUCATIONAL: Why Async?
+    ----------------------
+    The sync client waits for each response before sending the next request,
+    so fetching N pages costs the SUM of their latencies. With asyncio the
+    requests are in flight at the same time and the total is roughly the
+    SLOWEST single request. No CPU work changes - it's purely overlapping I/O.
+    
+    Usage:
+        async with AsyncAbandonedHomesClient(base_url, api_key) as client:
+            locations = await client.list_locations_all(total=1000)
+    """
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+        http2: bool = False
+    ):
+        """
+        Initialize the async API client.
+        
+        Args:
+            base_url: API base URL (e.g., 'http://localhost:8000')
+            api_key: Your API key
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts
+            retry_delay: Initial retry delay (doubles each retry, jittered)
+            max_retry_delay: Upper bound for any single wait
+            http2: Multiplex all requests over one connection
+                   (requires `pip install httpx[http2]`)
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("AsyncAbandonedHomesClient requires httpx (pip install httpx)")
+        
+        self.base_url = base_url.rstrip('/')
+        self._api_root = f"{self.base_url}/api/v1"  # Prefix of every endpoint URL
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        
+        # One AsyncClient = one connection pool shared by every request
+        self._client = httpx.AsyncClient(
+            headers={
+                'X-API-Key': api_key,
+                'Accept': 'application/json'
+            },
+            timeout=timeout,
+            http2=http2
+        )
+    
+    async def __aenter__(self) -> 'AsyncAbandonedHomesClient':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying connection pool"""
+        await self._client.aclose()
+    
+    # Status-code mapping is identical to the sync client
+    _handle_error = AbandonedHomesClient._handle_error
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        retry: bool = True,
+        extra_headers: dict = None,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], 'httpx.Response']:
+        """
+        Make an API request with error handling and retries.
+        
+        Same steps (and raw= option) as AbandonedHomesClient._request, but
+        waits with asyncio.sleep so other requests keep running during backoff.
+        """
+        url = self._api_root + endpoint
+        
+        attempts = 0
+        last_error = None
+        
+        while attempts <= self.max_retries:
+            try:
+                logger.debug(f"Request: {method} {url}")
+                
+                headers = dict(extra_headers) if extra_headers else {}
+                content = None
+                if data:
+                    content = _json_dumps(data)
+                    headers['Content-Type'] = 'application/json'
+                
+                response = await self._client.request(
+                    method, url, params=params, content=content, headers=headers or None
+                )
+                
+                logger.debug(f"Response: {response.status_code}")
+                
+                # Handle rate limiting
+                if response.status_code == 429:
+                    retry_after = min(int(response.headers.get('Retry-After', 60)), self.max_retry_delay)
+                    if retry and attempts < self.max_retries:
+                        logger.warning(f"Rate limited. Waiting {retry_after}s...")
+                        await asyncio.sleep(retry_after)
+                        attempts += 1
+                        continue
+                    raise RateLimitError(
+                        "Rate limit exceeded",
+                        status_code=429,
+                        retry_after=retry_after
+                    )
+                
+                # Handle errors
+                self._handle_error(response)
+                
+                if raw:
+                    return response
+                
+                # Return JSON or empty dict
+                if response.status_code == 204 or not response.content:
+                    return {}
+                return _json_loads(response.content)
+                
+            except httpx.RequestError as e:
+                # Network error - retry
+                last_error = e
+                if retry and attempts < self.max_retries:
+                    delay = _backoff_delay(self.retry_delay, attempts, self.max_retry_delay)
+                    logger.warning(f"Request failed: {e}. Retrying in {delay:.2f}s...")
+                    await asyncio.sleep(delay)
+                    attempts += 1
+                    continue
+                raise APIError(f"Network error: {e}")
+        
+        raise APIError(f"Max retries exceeded: {last_error}")
+    
+    async def get_location(self, location_id: str) -> Location:
+        """Get a single location by ID"""
+        response = await self._request('GET', f'/locations/{location_id}')
+        return Location.from_dict(response)
+    
+    async def list_locations(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        confirmed_only: bool = False,
+        condition: str = None,
+        min_confidence: float = None,
+        bbox: str = None
+    ) -> List[Location]:
+        """List one page of locations (see AbandonedHomesClient.list_locations)"""
+        params = _location_params(skip, limit, confirmed_only, condition, min_confidence, bbox)
+        
+        response = await self._request('GET', '/locations/', params=params)
+        return Location.from_many(response.get('items', []))
+    
+    async def list_locations_all(
+        self,
+        total: int,
+        page_size: int = 100,
+        **filters
+    ) -> List[Location]:
+        """
+        Fetch the first `total` locations by requesting every page at once.
+        
+        EDUCATIONAL: Fan-out with asyncio.gather
+        ---------------------------------------
+        We know the page offsets up front (0, 100, 200, ...), so there is no
+        reason to wait for page 1 before asking for page 2. gather() starts
+        all the requests and returns the results in the original order.
+        
+        Args:
+            total: Number of records to fetch
+            page_size: Records per request
+            **filters: Same filters as list_locations
+        """
+        pages = await asyncio.gather(*[
+            self.list_locations(skip=skip, limit=min(page_size, total - skip), **filters)
+            for skip in range(0, total, page_size)
+        ])
+        return [location for page in pages for location in page]
+    
+    async def get_prediction_status(self, job_id: str) -> PredictionJob:
+        """Get prediction job status"""
+        response = await self._request('GET', f'/predictions/{job_id}')
+        return PredictionJob.from_dict(response)
+    
+    async def wait_for_prediction(
+        self,
+        job_id: str,
+        poll_interval: float = 5.0,
+        timeout: float = 300.0
+    ) -> PredictionJob:
+        """
+        Wait for prediction job to complete without blocking the event loop.
+        
+        Uses the same backoff + ETag polling as the sync client. Several jobs
+        can be awaited concurrently:
+            await asyncio.gather(*[client.wait_for_prediction(j) for j in job_ids])
+        """
+        start_time = time.monotonic()
+        endpoint = f'/predictions/{job_id}'
+        status = None
+        etag = None
+        attempt = 0
+        
+        while True:
+            response = await self._request(
+                'GET', endpoint,
+                extra_headers={'If-None-Match': etag} if etag else None,
+                raw=True
+            )
+            if response.status_code != 304 or status is None:
+                status = PredictionJob.from_dict(_json_loads(response.content))
+                etag = response.headers.get('ETag')
+            
+            if status.status in ('completed', 'failed'):
+                return status
+            
+            elapsed = time.monotonic() - start_time
+            if elapsed >= timeout:
+                raise TimeoutError(f"Prediction job {job_id} timed out after {timeout}s")
+            
+            logger.info(f"Job {job_id}: {status.status} ({status.progress:.0%})")
+            await asyncio.sleep(_poll_delay(attempt, poll_interval))
+            attempt += 1
+
+
 # =============================================================================
 # USAGE EXAMPLES
 # =============================================================================
@@ -11,19 +11,49 @@ It handles:
 4. Docker Compose build and launch
 """
 
+import base64
+import hashlib
+import http.client
+import re
 import sys
 import shutil
-import secrets
 import subprocess
+import tempfile
 import time
 import os
 from pathlib import Path
 
-# ANSI colors for pretty output
-GREEN = "\033[92m"
-YELLOW = "\033[93m"
-RED = "\033[91m"
-RESET = "\033[0m"
+# ANSI colors for pretty output - decided once: only when writing to a
+# terminal that understands them, so `setup_wizard.py > log` stays clean
+_USE_COLOR = (
+    sys.stdout.isatty()
+    and 'NO_COLOR' not in os.environ
+    and (os.name != 'nt' or 'ANSICON' in os.environ or 'WT_SESSION' in os.environ)
+)
+if _USE_COLOR:
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    RED = "\033[91m"
+    RESET = "\033[0m"
+else:
+    GREEN = YELLOW = RED = RESET = ""
+
+# Project root (this file lives in <root>/scripts/)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# How long launch_application waits for the backend health endpoint
+HEALTH_TIMEOUT_S = 60
+
+# Compose command; check_prerequisites switches this to the v2 plugin
+# (`docker compose`) when available - a Go binary that starts much faster
+# than the Python-based docker-compose v1
+COMPOSE = ['docker-compose']
+
+# Fingerprint of the last successful build (see build_fingerprint)
+BUILD_CACHE_FILE = ".setup_wizard_cache"
+
+# Images the build produces (the `image:` names in docker-compose.yml)
+BUILT_IMAGES = ['abandoned-homes-backend:latest', 'abandoned-homes-frontend:latest']
 
 def print_step(message):
     print(f"\n{GREEN}==> {message}{RESET}")
@@ -34,13 +64,27 @@ def print_warn(message):
 def print_error(message):
     print(f"{RED}ERROR: {message}{RESET}")
 
-def check_command(command, name):
+def ask(message, default=''):
+    """input() that answers with `default` when nobody is at the keyboard (CI, </dev/null)."""
+    if not sys.stdin.isatty():
+        return default
+    return input(message).strip()
+
+def ask_setting(message, env_var):
+    """Use the value from `env_var` if set, otherwise prompt for it."""
+    return os.environ.get(env_var, '').strip() or ask(message)
+
+def run_probe(argv):
+    """Run a probe command quietly; True if it exits successfully."""
     try:
-        subprocess.check_call([command, '--version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        return subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+    except FileNotFoundError:
         return False
 
+def check_command(command, name):
+    # Presence only needs a PATH lookup, not a process
+    return shutil.which(command) is not None
+
 def check_prerequisites():
     print_step("Checking prerequisites...")
     
@@ -49,19 +93,25 @@ def check_prerequisites():
         ('git', 'Git'),
     ]
     
+    found = {cmd: check_command(cmd, name) for cmd, name in deps}
+    
     missing = []
     for cmd, name in deps:
-        if check_command(cmd, name):
+        if found[cmd]:
             print(f"  [x] {name} is installed")
         else:
             print(f"  [ ] {name} is MISSING")
             missing.append(name)
             
-    # Check for docker-compose (v1 or v2)
-    if check_command('docker-compose', 'Docker Compose'):
-        print("  [x] Docker Compose is installed")
-    elif check_command('docker', 'Docker') and subprocess.run(['docker', 'compose', 'version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0:
-         print("  [x] Docker Compose (plugin) is installed")
+    # Check for docker compose, preferring the v2 plugin over v1
+    # (the v2 plugin can't be found on PATH, so that one still needs a process)
+    global COMPOSE
+    if found['docker'] and run_probe(['docker', 'compose', 'version']):
+        COMPOSE = ['docker', 'compose']
+        print("  [x] Docker Compose (plugin) is installed - using 'docker compose'")
+    elif check_command('docker-compose', 'Docker Compose'):
+        COMPOSE = ['docker-compose']
+        print("  [x] Docker Compose is installed - using 'docker-compose'")
     else:
         print("  [ ] Docker Compose is MISSING")
         missing.append("Docker Compose")
@@ -69,102 +119,254 @@ def check_prerequisites():
     if missing:
         print_error(f"Please install the following tools before proceeding: {', '.join(missing)}")
         sys.exit(1)
+    
+    # The CLI being installed doesn't mean the daemon is running; without
+    # this the build would sit in a long connection timeout instead
+    try:
+        daemon_ok = subprocess.run(['docker', 'info'], stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, timeout=5).returncode == 0
+    except subprocess.TimeoutExpired:
+        daemon_ok = False
+    if not daemon_ok:
+        print_error("Docker daemon not reachable - is Docker running?")
+        sys.exit(1)
+    print("  [x] Docker daemon is running")
 
 def generate_env_file():
     print_step("Configuring Environment...")
     
-    root_dir = Path(__file__).resolve().parent.parent
-    env_example = root_dir / ".env.example"
-    env_target = root_dir / ".env"
+    env_example = ROOT_DIR / ".env.example"
+    env_target = ROOT_DIR / ".env"
     
     if not env_example.exists():
         print_error(".env.example not found! Are you in the right directory?")
         sys.exit(1)
 
     if env_target.exists():
-        response = input(f"{YELLOW}.env already exists. Overwrite? (y/N): {RESET}")
+        response = ask(f"{YELLOW}.env already exists. Overwrite? (y/N): {RESET}", default='n')
         if response.lower() != 'y':
             print("Skipping .env generation.")
             return
 
     # Read template
-    with open(env_example, 'r') as f:
-        content = f.read()
+    content = env_example.read_text(encoding='utf-8')
 
-    # Generate Secrets
-    api_key = secrets.token_hex(32)
-    jwt_secret = secrets.token_hex(32)
-    db_password = secrets.token_urlsafe(16)
+    # Generate Secrets: one read from the OS CSPRNG (the same source the
+    # secrets module uses), sliced and encoded exactly like
+    # token_hex(32) / token_hex(32) / token_urlsafe(16)
+    raw = os.urandom(32 + 32 + 16)
+    api_key = raw[:32].hex()
+    jwt_secret = raw[32:64].hex()
+    db_password = base64.urlsafe_b64encode(raw[64:]).rstrip(b'=').decode('ascii')
     
     print("  [x] Generated secure API Key")
     print("  [x] Generated secure JWT Secret")
     print("  [x] Generated secure Database Password")
 
-    # Replace placeholders
-    # We assume standard placeholders based on .env.example
-    # For a robust replacement, we'll manually reconstruct the file or use replace.
-    # Simple replace approach:
-    new_content = content.replace("generate_random_key_here", api_key)
-    new_content = new_content.replace("another_random_key_here", jwt_secret)
-    new_content = new_content.replace("change_this_secure_password", db_password)
+    # Placeholders we assume from the standard .env.example --> values
+    replacements = {
+        "generate_random_key_here": api_key,
+        "another_random_key_here": jwt_secret,
+        "change_this_secure_password": db_password,
+    }
     
     # Optional User Inputs
-    mapbox_key = input("\nEnter Mapbox Public Token (Press Enter to skip): ").strip()
-    if mapbox_key:
-        new_content += f"\nREACT_APP_MAPBOX_TOKEN={mapbox_key}\n"
+    # Optional settings can be supplied through the environment for
+    # unattended runs, e.g. MAPBOX_TOKEN=... python setup_wizard.py </dev/null
+    mapbox_key = ask_setting("\nEnter Mapbox Public Token (Press Enter to skip): ", 'MAPBOX_TOKEN')
     
-    sentinel_client = input("Enter Sentinel Hub Client ID (Press Enter to skip): ").strip()
+    sentinel_client = ask_setting("Enter Sentinel Hub Client ID (Press Enter to skip): ", 'SENTINEL_HUB_CLIENT_ID')
     if sentinel_client:
-        new_content = new_content.replace("SENTINEL_HUB_CLIENT_ID=", f"SENTINEL_HUB_CLIENT_ID={sentinel_client}")
+        replacements["SENTINEL_HUB_CLIENT_ID="] = f"SENTINEL_HUB_CLIENT_ID={sentinel_client}"
         
-    sentinel_secret = input("Enter Sentinel Hub Client Secret (Press Enter to skip): ").strip()
+    sentinel_secret = ask_setting("Enter Sentinel Hub Client Secret (Press Enter to skip): ", 'SENTINEL_HUB_CLIENT_SECRET')
     if sentinel_secret:
-        new_content = new_content.replace("SENTINEL_HUB_CLIENT_SECRET=", f"SENTINEL_HUB_CLIENT_SECRET={sentinel_secret}")
+        replacements["SENTINEL_HUB_CLIENT_SECRET="] = f"SENTINEL_HUB_CLIENT_SECRET={sentinel_secret}"
+    
+    # Replace every placeholder in one pass over the template
+    # (longest first, so no key can shadow a longer one that contains it)
+    pattern = re.compile("|".join(map(re.escape, sorted(replacements, key=len, reverse=True))))
+    new_content = pattern.sub(lambda m: replacements[m.group(0)], content)
+    
+    if mapbox_key:
+        new_content += f"\nREACT_APP_MAPBOX_TOKEN={mapbox_key}\n"
 
-    # Write file
-    with open(env_target, 'w') as f:
-        f.write(new_content)
+    # Write file atomically: write a temp file next to it, then swap it in
+    # with os.replace, so an interrupted run never leaves a truncated .env
+    tmp_target = env_target.with_name(env_target.name + ".tmp")
+    tmp_target.write_text(new_content, encoding='utf-8')
+    os.replace(tmp_target, env_target)
     
     print(f"  [x] wrote configuration to {env_target}")
 
-def launch_application():
-    print_step("Launching Application (this may take a few minutes)...")
+def build_fingerprint():
+    """
+    Hash of everything the images are built from, or None if unknown.
     
-    root_dir = Path(__file__).resolve().parent.parent
+    Covers the compose file, both Dockerfiles and the git commit. Returns
+    None (= always build) when this isn't a git checkout or the build
+    contexts have uncommitted/untracked changes, since those wouldn't be
+    reflected in the commit hash.
+    """
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=ROOT_DIR, capture_output=True, text=True)
     
-    # 1. Build
-    print("  Building containers...")
-    if subprocess.call(['docker-compose', 'build'], cwd=root_dir) != 0:
-        print_error("Build failed.")
-        sys.exit(1)
+    head = git('rev-parse', 'HEAD')
+    if head.returncode != 0:
+        return None
+    if git('status', '--porcelain', '--', 'backend', 'frontend', 'docker-compose.yml').stdout.strip():
+        return None
+    
+    digest = hashlib.sha256(head.stdout.encode())
+    for rel in ('docker-compose.yml', 'backend/Dockerfile', 'frontend/Dockerfile'):
+        digest.update((ROOT_DIR / rel).read_bytes())
+    return digest.hexdigest()
+
+def images_are_current(fingerprint):
+    """True if the last successful build had this fingerprint and its images still exist."""
+    cache = ROOT_DIR / BUILD_CACHE_FILE
+    if fingerprint is None or not cache.exists() or cache.read_text().strip() != fingerprint:
+        return False
+    # Inspect the built images themselves: `compose images` only lists images
+    # of existing containers, which says nothing after `compose down`
+    return run_probe(['docker', 'image', 'inspect', *BUILT_IMAGES])
+
+def start_build():
+    """
+    Start the image build in the background.
+    
+    Output goes to a log file rather than the terminal so it doesn't
+    interleave with the configuration prompts running meanwhile;
+    follow_build streams it once the prompts are done.
+    Returns (process, log_path, fingerprint); process and log_path are
+    None when the images are already up to date and no build is needed.
+    """
+    fingerprint = build_fingerprint()
+    if images_are_current(fingerprint):
+        return None, None, fingerprint
+    
+    # BuildKit builds independent stages in parallel and caches layers better
+    # than the legacy builder; the inline-cache build arg embeds cache
+    # metadata in the images so later builds can reuse them
+    env = {**os.environ, 'DOCKER_BUILDKIT': '1', 'COMPOSE_DOCKER_CLI_BUILD': '1'}
+    if run_probe(['docker', 'buildx', 'version']):
+        # bake builds every service in the compose file concurrently and
+        # tags them with their `image:` names, which `up` then reuses
+        cmd = ['docker', 'buildx', 'bake', '-f', 'docker-compose.yml', '--load',
+               '--set', '*.args.BUILDKIT_INLINE_CACHE=1']
+    else:
+        cmd = COMPOSE + ['build', '--build-arg', 'BUILDKIT_INLINE_CACHE=1']
+    
+    with tempfile.NamedTemporaryFile(prefix="setup-build-", suffix=".log", delete=False) as log:
+        proc = subprocess.Popen(cmd, cwd=ROOT_DIR, env=env,
+                                stdout=log, stderr=subprocess.STDOUT)
+    return proc, log.name, fingerprint
+
+def cancel_build(build):
+    """Stop a build from start_build and remove its log (no-op if none ran)."""
+    build_proc, build_log, _ = build
+    if build_proc is None:
+        return
+    build_proc.terminate()
+    build_proc.wait()
+    os.unlink(build_log)
+
+def follow_build(build_proc, build_log):
+    """
+    Echo the build log to the terminal until the build exits; returns its exit code.
+    
+    Whatever was logged while the prompts ran is printed first, then new
+    output is streamed as it arrives, like the build running in the foreground.
+    """
+    out = getattr(sys.stdout, 'buffer', None)
+    with open(build_log, 'rb') as log:
+        while True:
+            # Check for exit before reading so the final output isn't missed
+            finished = build_proc.poll() is not None
+            chunk = log.read()
+            if chunk:
+                if out is not None:
+                    out.write(chunk)
+                else:
+                    sys.stdout.write(chunk.decode(errors='replace'))
+                sys.stdout.flush()
+            elif finished:
+                return build_proc.returncode
+            else:
+                time.sleep(0.2)
+
+def launch_application(build=None):
+    print_step("Launching Application (this may take a few minutes)...")
+    
+    # 1. Build (normally already running since main() started it)
+    if build is None:
+        build = start_build()
+    build_proc, build_log, fingerprint = build
+    if build_proc is None:
+        print("  Containers are up to date, skipping build.")
+    else:
+        print(f"  Building containers (log: {build_log})...")
+        sys.stdout.flush()
+        if follow_build(build_proc, build_log) != 0:
+            # Keep the log only on failure, where its path is printed
+            print_error(f"Build failed. See {build_log}")
+            sys.exit(1)
+        os.unlink(build_log)
+        if fingerprint:
+            (ROOT_DIR / BUILD_CACHE_FILE).write_text(fingerprint)
         
     # 2. Up
     print("  Starting services...")
-    if subprocess.call(['docker-compose', 'up', '-d'], cwd=root_dir) != 0:
+    if subprocess.call(COMPOSE + ['up', '-d'], cwd=ROOT_DIR) != 0:
         print_error("Failed to start services.")
         sys.exit(1)
         
     # 3. Health Check Loop
     print("  Waiting for backend to be healthy...")
-    retries = 30
-    import urllib.request
-    import urllib.error
     
-    # Using backend URL from docker-compose defaults (localhost:8000)
-    health_url = "http://localhost:8000/health"
+    # Using backend URL from docker-compose defaults (localhost:8000).
+    # One keep-alive connection is reused for every poll instead of a new
+    # TCP handshake per attempt; after an error it is closed and
+    # http.client reconnects on the next request.
+    conn = http.client.HTTPConnection("localhost", 8000, timeout=2)
+    
+    # Poll on a doubling schedule (0.25, 0.5, 1, 2, 2, 2, ...s) against an
+    # overall deadline: a backend that comes up right away is noticed within
+    # a fraction of a second, and a slow one is still polled every 2s.
+    # Each attempt gets a short timeout so one hung connection can't eat the
+    # whole budget. Refused/reset connections just mean the app isn't
+    # listening yet (Docker's port proxy resets rather than refuses while
+    # the container boots), so both keep us waiting.
+    deadline = time.monotonic() + HEALTH_TIMEOUT_S
+    delay = 0.25
+    attempt = 0
     
-    for i in range(retries):
-        try:
-            with urllib.request.urlopen(health_url) as response:
+    try:
+        while True:
+            try:
+                conn.request("GET", "/health")
+                response = conn.getresponse()
+                response.read()  # drain the body so the connection can be reused
                 if response.status == 200:
                     print(f"  {GREEN}[x] Backend is online!{RESET}")
                     break
-        except Exception:
-            time.sleep(2)
+            except (OSError, http.client.HTTPException):
+                # Refused/reset/timed out (OSError) or a garbled response.
+                # Anything else - including Ctrl-C - propagates.
+                conn.close()
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print_warn("Backend timed out, but containers are running. Check logs with 'make logs'.")
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 2.0)
+            attempt += 1
             sys.stdout.write(".")
-            sys.stdout.flush()
-    else:
-        print_warn("Backend timed out, but containers are running. Check logs with 'make logs'.")
+            if attempt % 5 == 0:
+                sys.stdout.flush()  # progress dots are flushed in batches
+    finally:
+        conn.close()
 
 def main():
     print(f"""
@@ -174,13 +376,23 @@ def main():
 """)
     
     check_prerequisites()
-    generate_env_file()
     
-    launch = input("\nReady to build and launch? (Y/n): ").strip()
+    # The image build doesn't depend on .env, so start it now and let it
+    # run while the user answers the configuration prompts
+    build = start_build()
+    try:
+        generate_env_file()
+        launch = ask("\nReady to build and launch? (Y/n): ", default='y')
+    except BaseException:
+        # Aborted (Ctrl-C, missing .env.example, ...) - don't leave the build running
+        cancel_build(build)
+        raise
+    
     if launch.lower() == 'n':
+        cancel_build(build)
         print("Setup completed without launching.")
     else:
-        launch_application()
+        launch_application(build)
         
     print(f"""
 {GREEN}================================================
@@ -191,8 +403,8 @@ def main():
    API Docs: http://localhost:8000/docs
    
    Common commands:
-   - Stop app: docker-compose down
-   - View logs: docker-compose logs -f
+   - Stop app: {' '.join(COMPOSE)} down
+   - View logs: {' '.join(COMPOSE)} logs -f
    
 ================================================{RESET}
 """)